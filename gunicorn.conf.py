@@ -0,0 +1,24 @@
+# Gunicorn settings shared by the Dockerfile, Procfile and Railway start command.
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8080')}"
+
+# Each worker process owns its own browser pool and Chromium processes. One
+# worker keeps a small Hobby instance within its memory limit; raise
+# WEB_CONCURRENCY on larger machines.
+workers = int(os.environ.get('WEB_CONCURRENCY', 1))
+
+# Scraping requests mostly wait on Playwright I/O, so threads let them overlap.
+# Chromium runs on the worker's browser pool (BROWSER_POOL_SIZE browsers), not
+# per request thread, so extra threads mainly keep /health and cached
+# responses from queueing behind a scrape.
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 2))
+
+# Load the app in each worker: Playwright drivers must not be shared across fork().
+preload_app = False
+
+timeout = 120
+graceful_timeout = 30
+accesslog = '-'
+errorlog = '-'
@@ -1,18 +1,34 @@
 from datetime import datetime
 from functools import wraps
+import hashlib
 import logging
 import os
 import json
 import secrets
-from flask import Flask, jsonify, render_template, Response, request, send_file
-from playwright.sync_api import sync_playwright
+import threading
+from cachetools import TTLCache
+import orjson
+from flask import Flask, jsonify, render_template, Response, request, send_file, stream_with_context
+import requests
+from utils.browser_pool import create_browser_pool
+from utils.fia_api import (
+    FiaPageError,
+    fetch_seasons,
+    fetch_championships,
+    fetch_events,
+    fetch_dropdowns
+)
 from utils.playwright_utils import (
+    run_on_fia_page,
+    open_fia_documents_page,
     select_option_by_type,
+    SelectionResult,
     get_docs,
     download_file,
     get_available_seasons,
     get_available_championships,
     get_available_events,
+    get_available_dropdowns,
     normalize_season_format
 )
 from utils.track_assets_utils import normalize_track_name, get_track_assets_dirs
@@ -24,26 +40,82 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__)
 
 # Configuration constants
-FIA_DOCUMENTS_URL = 'https://www.fia.com/documents/championships/fia-formula-one-world-championship-14/season/'
 BROWSER_LAUNCH_OPTIONS = {
     'headless': True,
     # Railway containers have a small /dev/shm allocation. Keeping Chromium's
     # shared-memory files under /tmp avoids renderer crashes on document pages.
     'args': ['--disable-dev-shm-usage']
 }
-FIA_PAGE_READY_TIMEOUT_MS = 15_000
-
-def open_fia_documents_page(page) -> None:
-    """Open the FIA page and wait for the form actually used by the scraper."""
-    page.goto(
-        FIA_DOCUMENTS_URL,
-        wait_until='domcontentloaded',
-        timeout=30_000
-    )
-    page.locator('.select-field-wrapper select').first.wait_for(
-        state='visible',
-        timeout=FIA_PAGE_READY_TIMEOUT_MS
-    )
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# Seasons, championships and events only change a few times per season.
+METADATA_CACHE_TTL_SECONDS = 3600
+
+# Chromium stays warm between requests on the pool's own threads; every
+# request still gets its own context.
+browser_pool = create_browser_pool(launch_options=BROWSER_LAUNCH_OPTIONS)
+
+# Serialized discovery responses keyed by endpoint and season. TTLCache is not
+# thread-safe, so every access goes through the lock.
+metadata_cache = TTLCache(maxsize=128, ttl=METADATA_CACHE_TTL_SECONDS)
+metadata_cache_lock = threading.Lock()
+
+def fetch_without_browser(fetcher, **kwargs):
+    """
+    Read FIA filter options over plain HTTP.
+    Returns None when the page could not be used, so callers fall back to Playwright.
+    """
+    try:
+        return fetcher(**kwargs)
+    except (requests.RequestException, FiaPageError) as e:
+        logger.warning(f"Plain HTTP retrieval failed, falling back to Playwright: {e}")
+        return None
+
+def wants_pretty_json() -> bool:
+    """Indented JSON is opt-in through the `pretty=1` query parameter."""
+    return request.args.get('pretty') == '1'
+
+def serialize_json(response_data: dict) -> bytes:
+    """
+    Serialize a response body with orjson.
+    Unlike jsonify(), which sorts keys, orjson keeps dictionary insertion order,
+    so 'message' stays before 'documents' and 'info' before 'docs'.
+    """
+    option = orjson.OPT_INDENT_2 if wants_pretty_json() else 0
+    return orjson.dumps(response_data, option=option)
+
+def get_cached_metadata(cache_key):
+    """Return a cached discovery response body, or None on a miss."""
+    with metadata_cache_lock:
+        return metadata_cache.get((*cache_key, wants_pretty_json()))
+
+def store_metadata(cache_key, response_data: dict, *, cacheable: bool) -> bytes:
+    """
+    Serialize a discovery response and cache it when `cacheable` is True.
+    Callers pass False for empty scrapes and for default-season lists returned
+    because the requested season could not be selected.
+    """
+    body = serialize_json(response_data)
+    if cacheable:
+        with metadata_cache_lock:
+            metadata_cache[(*cache_key, wants_pretty_json())] = body
+    return body
+
+def metadata_response(body: bytes, *, cacheable: bool = True) -> Response:
+    """
+    Build a JSON discovery response. Cacheable responses carry max-age and an ETag
+    (answering 304 when the client's ETag matches); the others are sent with
+    no-store, so clients do not keep a result the server itself refused to cache.
+    """
+    response = Response(body, mimetype='application/json')
+    if not cacheable:
+        response.cache_control.no_store = True
+        return response
+
+    # Private: the endpoints sit behind the API key, so shared caches must not reuse them.
+    response.cache_control.private = True
+    response.cache_control.max_age = METADATA_CACHE_TTL_SECONDS
+    response.set_etag(hashlib.md5(body).hexdigest()[:16], weak=True)
+    return response.make_conditional(request)
 
 def require_api_key(view_function):
     """Require the API key configured in the FIA_DOCS_API_KEY environment variable."""
@@ -116,13 +188,8 @@ def get_fia_documents():
     championship = request.args.get('championship', CHAMPIONSHIP_FALLBACK_VALUE)
     event = request.args.get('event', EVENT_FALLBACK_VALUE)
 
-    documents = []
-
-    with sync_playwright() as p:
-        browser = p.chromium.launch(**BROWSER_LAUNCH_OPTIONS)
-        page = browser.new_page()
-
-        open_fia_documents_page(page)
+    def select_and_get_docs(page):
+        nonlocal season
 
         # Select options in order
         logger.info("STARTING SELECTIONS...\n")
@@ -135,15 +202,17 @@ def get_fia_documents():
         if season:
             season_selected = select_option_by_type(page=page, select_field_name=SELECT_FIELD_SEASON_DEFAULT_VALUE, option_text=season)
             
-            # If season selection failed (e.g. new season data not yet available), reload page and try with previous year as fallback
+            # If season selection failed (e.g. new season data not yet available), try with previous year as fallback
             if not season_selected:
                 current_year = datetime.now().year
                 previous_year = current_year - 1
                 fallback_season = f"SEASON {previous_year}"
-                logger.info(f"Season {season} not available, reloading page and trying fallback: {fallback_season}\n")
+                logger.info(f"Season {season} not available, trying fallback: {fallback_season}\n")
                 
-                # Reload the page
-                open_fia_documents_page(page)
+                # A missing option leaves the form untouched; any other failure
+                # may have left the page mid-navigation, so start from a fresh load.
+                if season_selected is not SelectionResult.OPTION_NOT_FOUND:
+                    open_fia_documents_page(page)
                 
                 # Try with previous year
                 season_selected = select_option_by_type(page=page, select_field_name=SELECT_FIELD_SEASON_DEFAULT_VALUE, option_text=fallback_season)
@@ -165,23 +234,16 @@ def get_fia_documents():
         # Get documents after all selections are made
         logger.info("GETTING DOCUMENTS...\n")
 
-        documents = get_docs(page=page)
+        return get_docs(page=page)
 
-        browser.close()
+    documents = run_on_fia_page(pool=browser_pool, task=select_and_get_docs)
 
     response_data = {
         'message': 'FIA documents retrieved',
         'documents': documents
     }
 
-    # Use Response + json.dumps instead of jsonify() to preserve field ordering
-    # jsonify() may reorder dictionary keys during serialization, but json.dumps()
-    # respects the insertion order of Python dictionaries (Python 3.7+)
-    # This ensures 'message' appears before 'documents' and 'info' before 'docs'
-    return Response(
-        json.dumps(response_data, ensure_ascii=False, indent=2),
-        mimetype='application/json'
-    )
+    return Response(serialize_json(response_data), mimetype='application/json')
 
 @app.route('/download-fia-doc', methods=['GET'])
 @require_api_key
@@ -193,12 +255,22 @@ def download_document():
     try:
         response, filename = download_file(url=url)
         if response and filename:
+            headers = {
+                'Content-Disposition': f'attachment; filename="{filename}"',
+                'Content-Type': 'application/pdf'
+            }
+            # iter_content decodes compressed bodies, so the upstream length only
+            # matches what we stream when no Content-Encoding was applied.
+            content_length = response.headers.get('Content-Length')
+            if content_length and not response.headers.get('Content-Encoding'):
+                headers['Content-Length'] = content_length
+
+            # Stream chunks straight through; direct_passthrough skips Werkzeug's
+            # per-chunk body handling so the PDF is never buffered in memory.
             flask_response = Response(
-                response.iter_content(chunk_size=8192),
-                headers={
-                    'Content-Disposition': f'attachment; filename="{filename}"',
-                    'Content-Type': 'application/pdf'
-                }
+                stream_with_context(response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE)),
+                headers=headers,
+                direct_passthrough=True
             )
             flask_response.call_on_close(response.close)
             return flask_response
@@ -213,26 +285,30 @@ def get_seasons_available():
     """
     Get all available seasons from FIA documents page
     """
+    cache_key = ('seasons',)
+    cached_body = get_cached_metadata(cache_key)
+    if cached_body is not None:
+        logger.info("SEASONS SERVED FROM CACHE\n")
+        return metadata_response(cached_body)
+
     try:
         logger.info("STARTING SEASONS RETRIEVAL...\n")
         
-        with sync_playwright() as p:
-            browser = p.chromium.launch(**BROWSER_LAUNCH_OPTIONS)
-            page = browser.new_page()
-            
-            logger.info("NAVIGATING TO FIA DOCUMENTS PAGE...")
-            open_fia_documents_page(page)
-            
-            # Get available seasons
-            logger.info("EXTRACTING AVAILABLE SEASONS...\n")
-            seasons = get_available_seasons(page=page)
-            
-            logger.info(f"FOUND {len(seasons)} AVAILABLE SEASONS")
-            for i, season in enumerate(seasons, 1):
-                logger.info(f"  {i}. {season}")
-            logger.info("")
-            
-            browser.close()
+        logger.info("READING SEASONS FROM FIA DOCUMENTS PAGE HTML...")
+        seasons = fetch_without_browser(fetch_seasons)
+
+        if seasons is None:
+            def scrape_seasons(page):
+                # Get available seasons
+                logger.info("EXTRACTING AVAILABLE SEASONS...\n")
+                return get_available_seasons(page=page)
+
+            seasons = run_on_fia_page(pool=browser_pool, task=scrape_seasons)
+
+        logger.info(f"FOUND {len(seasons)} AVAILABLE SEASONS")
+        for i, season in enumerate(seasons, 1):
+            logger.info(f"  {i}. {season}")
+        logger.info("")
             
         response_data = {
             'message': 'Available seasons retrieved',
@@ -242,10 +318,9 @@ def get_seasons_available():
         
         logger.info("SEASONS RETRIEVAL COMPLETED SUCCESSFULLY\n")
         
-        return Response(
-            json.dumps(response_data, ensure_ascii=False, indent=2),
-            mimetype='application/json'
-        )
+        cacheable = bool(seasons)
+        body = store_metadata(cache_key, response_data, cacheable=cacheable)
+        return metadata_response(body, cacheable=cacheable)
         
     except Exception as e:
         logger.error(f"Error retrieving seasons: {e}")
@@ -271,30 +346,39 @@ def get_championships_available():
         if season and normalized_season != season:
             logger.info(f"Season (normalized): {normalized_season}")
         logger.info("")
+
+        cache_key = ('championships', season)
+        cached_body = get_cached_metadata(cache_key)
+        if cached_body is not None:
+            logger.info("CHAMPIONSHIPS SERVED FROM CACHE\n")
+            return metadata_response(cached_body)
         
-        with sync_playwright() as p:
-            browser = p.chromium.launch(**BROWSER_LAUNCH_OPTIONS)
-            page = browser.new_page()
-            
-            logger.info("NAVIGATING TO FIA DOCUMENTS PAGE...")
-            open_fia_documents_page(page)
-            
-            # Select season if provided
-            if season:
-                logger.info(f"SELECTING SEASON: {normalized_season}")
-            else:
-                logger.info("USING DEFAULT SEASON SELECTION")
-            
-            # Get available championships (optionally for a specific season)
-            logger.info("EXTRACTING AVAILABLE CHAMPIONSHIPS...\n")
-            championships = get_available_championships(page=page, season=season)
-            
-            logger.info(f"FOUND {len(championships)} AVAILABLE CHAMPIONSHIPS")
-            for i, championship in enumerate(championships, 1):
-                logger.info(f"  {i}. {championship}")
-            logger.info("")
-            
-            browser.close()
+        logger.info("READING CHAMPIONSHIPS FROM FIA DOCUMENTS PAGE HTML...")
+        championships_result = fetch_without_browser(fetch_championships, season=normalized_season)
+
+        if championships_result is None:
+            def scrape_championships(page):
+                # Select season if provided
+                if season:
+                    logger.info(f"SELECTING SEASON: {normalized_season}")
+                else:
+                    logger.info("USING DEFAULT SEASON SELECTION")
+
+                # Get available championships (optionally for a specific season)
+                logger.info("EXTRACTING AVAILABLE CHAMPIONSHIPS...\n")
+                return get_available_championships(page=page, season=season)
+
+            championships_result = run_on_fia_page(pool=browser_pool, task=scrape_championships)
+
+        championships, season_applied = championships_result
+        if not season_applied:
+            # The default season's list is still returned, but never cached under this season
+            logger.warning(f"Season {normalized_season} could not be selected; returning default season championships")
+
+        logger.info(f"FOUND {len(championships)} AVAILABLE CHAMPIONSHIPS")
+        for i, championship in enumerate(championships, 1):
+            logger.info(f"  {i}. {championship}")
+        logger.info("")
             
         response_data = {
             'message': 'Available championships retrieved',
@@ -305,10 +389,9 @@ def get_championships_available():
         
         logger.info("CHAMPIONSHIPS RETRIEVAL COMPLETED SUCCESSFULLY\n")
         
-        return Response(
-            json.dumps(response_data, ensure_ascii=False, indent=2),
-            mimetype='application/json'
-        )
+        cacheable = bool(championships) and season_applied
+        body = store_metadata(cache_key, response_data, cacheable=cacheable)
+        return metadata_response(body, cacheable=cacheable)
         
     except Exception as e:
         logger.error(f"Error retrieving championships: {e}")
@@ -334,30 +417,39 @@ def get_gp_available():
         if season and normalized_season != season:
             logger.info(f"Season (normalized): {normalized_season}")
         logger.info("")
+
+        cache_key = ('events', season)
+        cached_body = get_cached_metadata(cache_key)
+        if cached_body is not None:
+            logger.info("GRAND PRIX EVENTS SERVED FROM CACHE\n")
+            return metadata_response(cached_body)
         
-        with sync_playwright() as p:
-            browser = p.chromium.launch(**BROWSER_LAUNCH_OPTIONS)
-            page = browser.new_page()
-            
-            logger.info("NAVIGATING TO FIA DOCUMENTS PAGE...")
-            open_fia_documents_page(page)
-            
-            # Select season if provided
-            if season:
-                logger.info(f"SELECTING SEASON: {normalized_season}")
-            else:
-                logger.info("USING DEFAULT SEASON SELECTION")
-            
-            # Get available events/Grand Prix (optionally for a specific season)
-            logger.info("EXTRACTING AVAILABLE GRAND PRIX EVENTS...\n")
-            events = get_available_events(page=page, season=season)
-            
-            logger.info(f"FOUND {len(events)} AVAILABLE GRAND PRIX EVENTS")
-            for i, event in enumerate(events, 1):
-                logger.info(f"  {i}. {event}")
-            logger.info("")
-            
-            browser.close()
+        logger.info("READING GRAND PRIX EVENTS FROM FIA DOCUMENTS PAGE HTML...")
+        events_result = fetch_without_browser(fetch_events, season=normalized_season)
+
+        if events_result is None:
+            def scrape_events(page):
+                # Select season if provided
+                if season:
+                    logger.info(f"SELECTING SEASON: {normalized_season}")
+                else:
+                    logger.info("USING DEFAULT SEASON SELECTION")
+
+                # Get available events/Grand Prix (optionally for a specific season)
+                logger.info("EXTRACTING AVAILABLE GRAND PRIX EVENTS...\n")
+                return get_available_events(page=page, season=season)
+
+            events_result = run_on_fia_page(pool=browser_pool, task=scrape_events)
+
+        events, season_applied = events_result
+        if not season_applied:
+            # The default season's list is still returned, but never cached under this season
+            logger.warning(f"Season {normalized_season} could not be selected; returning default season events")
+
+        logger.info(f"FOUND {len(events)} AVAILABLE GRAND PRIX EVENTS")
+        for i, event in enumerate(events, 1):
+            logger.info(f"  {i}. {event}")
+        logger.info("")
             
         response_data = {
             'message': 'Available Grand Prix events retrieved',
@@ -368,15 +460,82 @@ def get_gp_available():
         
         logger.info("GRAND PRIX EVENTS RETRIEVAL COMPLETED SUCCESSFULLY\n")
         
-        return Response(
-            json.dumps(response_data, ensure_ascii=False, indent=2),
-            mimetype='application/json'
-        )
+        cacheable = bool(events) and season_applied
+        body = store_metadata(cache_key, response_data, cacheable=cacheable)
+        return metadata_response(body, cacheable=cacheable)
         
     except Exception as e:
         logger.error(f"Error retrieving Grand Prix events: {e}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/get-dropdowns-available', methods=['GET'])
+@require_api_key
+def get_dropdowns_available():
+    """
+    Get seasons, championships and Grand Prix events for a season in one call
+    Optional parameter: season - if not provided, uses current default
+    """
+    # Get optional season parameter
+    season = request.args.get('season')
+
+    try:
+        logger.info("STARTING DROPDOWNS RETRIEVAL...\n")
+        logger.info("PARAMETERS:")
+        logger.info(f"Season (original): {season if season else 'default'}")
+
+        # Normalize season format if provided
+        normalized_season = normalize_season_format(season) if season else None
+        if season and normalized_season != season:
+            logger.info(f"Season (normalized): {normalized_season}")
+        logger.info("")
+
+        cache_key = ('dropdowns', season)
+        cached_body = get_cached_metadata(cache_key)
+        if cached_body is not None:
+            logger.info("DROPDOWNS SERVED FROM CACHE\n")
+            return metadata_response(cached_body)
+
+        logger.info("READING DROPDOWNS FROM FIA DOCUMENTS PAGE HTML...")
+        dropdowns_result = fetch_without_browser(fetch_dropdowns, season=normalized_season)
+
+        if dropdowns_result is None:
+            def scrape_dropdowns(page):
+                # All three selects are read from the same (season) page
+                logger.info("EXTRACTING AVAILABLE DROPDOWNS...\n")
+                return get_available_dropdowns(page=page, season=season)
+
+            dropdowns_result = run_on_fia_page(pool=browser_pool, task=scrape_dropdowns)
+
+        dropdowns, season_applied = dropdowns_result
+        if not season_applied:
+            # The default season's list is still returned, but never cached under this season
+            logger.warning(f"Season {normalized_season} could not be selected; returning default season dropdowns")
+
+        logger.info(
+            f"FOUND {len(dropdowns['seasons'])} SEASONS, "
+            f"{len(dropdowns['championships'])} CHAMPIONSHIPS, "
+            f"{len(dropdowns['events'])} GRAND PRIX EVENTS\n"
+        )
+
+        response_data = {
+            'message': 'Available dropdowns retrieved',
+            'season': season if season else 'default',
+            'seasons': dropdowns['seasons'],
+            'championships': dropdowns['championships'],
+            'events': dropdowns['events']
+        }
+
+        logger.info("DROPDOWNS RETRIEVAL COMPLETED SUCCESSFULLY\n")
+
+        # A half-loaded page can list seasons without championships; events may
+        # legitimately be empty early in a season.
+        cacheable = bool(dropdowns['seasons']) and bool(dropdowns['championships']) and season_applied
+        body = store_metadata(cache_key, response_data, cacheable=cacheable)
+        return metadata_response(body, cacheable=cacheable)
+
+    except Exception as e:
+        logger.error(f"Error retrieving dropdowns: {e}")
+        return jsonify({'error': str(e)}), 500
 
 @app.route('/track-image', methods=['GET'])
 def get_track_image():
@@ -414,5 +573,6 @@ def get_track_image():
     }), 404
 
 if __name__ == '__main__':
+    # Local development only; deployments run Gunicorn with gunicorn.conf.py.
     port = int(os.environ.get("PORT", 4050))  # Use 4050 in local, otherwise the PORT of Railway
     app.run(host='0.0.0.0', port=port)
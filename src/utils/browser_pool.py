@@ -0,0 +1,182 @@
+import atexit
+import logging
+import os
+import queue
+import threading
+from concurrent.futures import Future
+from playwright.sync_api import sync_playwright
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_BROWSER_POOL_SIZE = 2
+DEFAULT_BROWSER_MAX_USES = 50
+BROWSER_POOL_SHUTDOWN_TIMEOUT_SECONDS = 10
+# The scraper only reads the DOM, so these downloads only slow navigation down.
+# Stylesheets stay enabled: innerText applies CSS (text-transform, display), so
+# blocking them would change the scraped event and document titles.
+DEFAULT_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media'})
+DEFAULT_CONTEXT_OPTIONS = {
+    # Requests answered by a service worker bypass context.route(), so the
+    # resource blocking above would silently stop applying.
+    'service_workers': 'block'
+}
+
+class BrowserPool:
+    """
+    Keep Chromium warm between requests instead of launching it for every call.
+
+    Playwright's sync API is bound to the thread that started it, so the pool
+    runs a fixed number of long-lived owner threads, each with its own
+    Playwright driver and Browser. Request threads hand work to them through
+    `run()`; the number of Chromium processes therefore stays at `size` no
+    matter how many threads the web server creates. Each task gets a fresh
+    BrowserContext, and a Browser is recycled after `max_uses` contexts to keep
+    long-running Chromium memory growth in check.
+    """
+
+    def __init__(
+        self,
+        *,
+        launch_options: dict,
+        size: int = DEFAULT_BROWSER_POOL_SIZE,
+        max_uses: int = DEFAULT_BROWSER_MAX_USES,
+        blocked_resource_types: frozenset = DEFAULT_BLOCKED_RESOURCE_TYPES,
+        context_options: dict = DEFAULT_CONTEXT_OPTIONS
+    ):
+        self.launch_options = launch_options
+        self.context_options = context_options
+        self.size = size
+        self.max_uses = max_uses
+        self.blocked_resource_types = blocked_resource_types
+        self._tasks = queue.Queue()
+        self._workers = []
+        self._workers_lock = threading.Lock()
+        self._closed = False
+        atexit.register(self.close)
+
+    def _start_workers(self) -> None:
+        """Start the owner threads on first use, after any Gunicorn fork."""
+        with self._workers_lock:
+            if self._closed:
+                raise RuntimeError("Browser pool is closed")
+            if self._workers:
+                return
+
+            for index in range(self.size):
+                # Daemon threads: atexit runs only after non-daemon threads end.
+                worker = threading.Thread(
+                    target=self._worker_loop,
+                    name=f"browser-pool-{index}",
+                    daemon=True
+                )
+                worker.start()
+                self._workers.append(worker)
+
+    def _route_request(self, route) -> None:
+        """Abort asset downloads that are not needed to read the page."""
+        if route.request.resource_type in self.blocked_resource_types:
+            route.abort()
+        else:
+            route.continue_()
+
+    def _run_in_context(self, browser, task):
+        """Run a task on a page in a fresh BrowserContext, closing the context afterwards."""
+        context = browser.new_context(**self.context_options)
+        try:
+            if self.blocked_resource_types:
+                context.route("**/*", self._route_request)
+            return task(context.new_page())
+        finally:
+            context.close()
+
+    def _worker_loop(self) -> None:
+        """Own one Playwright driver and Browser; only this thread ever touches them."""
+        playwright = None
+        browser = None
+        uses = 0
+
+        def close_browser():
+            for close in (
+                browser.close if browser else None,
+                playwright.stop if playwright else None
+            ):
+                if close is None:
+                    continue
+                try:
+                    close()
+                except Exception as e:
+                    logger.warning(f"Error while closing pooled browser: {e}")
+
+        try:
+            while True:
+                item = self._tasks.get()
+                if item is None:
+                    # Shutdown sentinel from close()
+                    return
+
+                task, future = item
+                if not future.set_running_or_notify_cancel():
+                    continue
+
+                try:
+                    if browser is not None and (
+                        uses >= self.max_uses or not browser.is_connected()
+                    ):
+                        logger.info(f"RECYCLING POOLED BROWSER AFTER {uses} USES")
+                        close_browser()
+                        playwright = browser = None
+
+                    if browser is None:
+                        logger.info("LAUNCHING POOLED BROWSER...")
+                        playwright = sync_playwright().start()
+                        try:
+                            browser = playwright.chromium.launch(**self.launch_options)
+                        except Exception:
+                            # Stop the driver so a failed launch does not leak it.
+                            close_browser()
+                            playwright = None
+                            raise
+                        uses = 0
+
+                    uses += 1
+                    future.set_result(self._run_in_context(browser, task))
+                except Exception as e:
+                    future.set_exception(e)
+        finally:
+            close_browser()
+
+    def run(self, task):
+        """
+        Run `task(page)` on a pooled browser and return its result.
+
+        Args:
+            task (callable): Function receiving a Playwright page in a fresh context
+
+        Returns:
+            The value returned by the task; exceptions raised by it are re-raised here
+        """
+        self._start_workers()
+        future = Future()
+        self._tasks.put((task, future))
+        return future.result()
+
+    def close(self) -> None:
+        """Ask every owner thread to close its browser; registered with atexit."""
+        with self._workers_lock:
+            self._closed = True
+            workers = list(self._workers)
+
+        for _ in workers:
+            self._tasks.put(None)
+        for worker in workers:
+            worker.join(timeout=BROWSER_POOL_SHUTDOWN_TIMEOUT_SECONDS)
+
+def create_browser_pool(*, launch_options: dict) -> BrowserPool:
+    """
+    Build the process-wide pool, honouring the BROWSER_POOL_SIZE and
+    BROWSER_MAX_USES environment variables.
+    """
+    size = int(os.environ.get('BROWSER_POOL_SIZE', DEFAULT_BROWSER_POOL_SIZE))
+    max_uses = int(os.environ.get('BROWSER_MAX_USES', DEFAULT_BROWSER_MAX_USES))
+    return BrowserPool(launch_options=launch_options, size=size, max_uses=max_uses)
@@ -0,0 +1,201 @@
+import logging
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+import requests
+from requests.adapters import HTTPAdapter
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+FIA_DOCUMENTS_URL = 'https://www.fia.com/documents/championships/fia-formula-one-world-championship-14/season/'
+FIA_PAGE_REQUEST_TIMEOUT = (5, 15)
+FIA_PAGE_REQUEST_HEADERS = {
+    'User-Agent': (
+        'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 '
+        '(KHTML, like Gecko) Chrome/139.0 Safari/537.36'
+    ),
+    'Accept': 'text/html,application/xhtml+xml'
+}
+
+# Shared session so page fetches and document downloads reuse kept-alive TLS connections to fia.com
+FIA_HTTP_SESSION = requests.Session()
+FIA_HTTP_SESSION.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=32))
+
+class FiaPageError(Exception):
+    """Raised when the FIA page HTML does not contain the expected filters."""
+
+class _SelectFieldsParser(HTMLParser):
+    """Collect the options of every <select>, keyed by its placeholder option text."""
+
+    def __init__(self):
+        super().__init__()
+        self.select_fields = {}
+        self._options = None
+        self._option = None
+
+    def _close_option(self):
+        if self._option is not None:
+            self._option['text'] = self._option['text'].strip()
+            self._options.append(self._option)
+            self._option = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'select':
+            self._options = []
+        elif tag == 'option' and self._options is not None:
+            # Browsers implicitly close an open <option> when the next one starts.
+            self._close_option()
+            self._option = {'value': dict(attrs).get('value') or '', 'text': ''}
+
+    def handle_endtag(self, tag):
+        if tag == 'option' and self._options is not None:
+            self._close_option()
+        elif tag == 'select' and self._options is not None:
+            self._close_option()
+            placeholder = next(
+                (option['text'] for option in self._options if option['value'] == '0'),
+                None
+            )
+            if placeholder:
+                self.select_fields[placeholder] = [
+                    option for option in self._options
+                    if option['value'] != '0' and option['value'] and option['text']
+                ]
+            self._options = None
+
+    def handle_data(self, data):
+        if self._option is not None:
+            self._option['text'] += data
+
+def _fetch_select_fields(*, url) -> dict[str, list[dict]]:
+    """
+    Download a FIA documents page and parse its filter selects.
+
+    Args:
+        url (str): FIA documents page URL
+
+    Returns:
+        dict: Options ({'value', 'text'}) keyed by select placeholder ("Season", ...)
+    """
+    response = FIA_HTTP_SESSION.get(
+        url,
+        headers=FIA_PAGE_REQUEST_HEADERS,
+        timeout=FIA_PAGE_REQUEST_TIMEOUT
+    )
+    response.raise_for_status()
+
+    parser = _SelectFieldsParser()
+    parser.feed(response.text)
+    parser.close()
+
+    if not parser.select_fields:
+        # Typically a bot challenge or a layout change; the browser path handles both.
+        raise FiaPageError(f"No filter selects found in {response.url}")
+
+    return parser.select_fields
+
+def _get_field_options(*, select_fields, select_field_name) -> list[str]:
+    if select_field_name not in select_fields:
+        raise FiaPageError(f"Select field {select_field_name} was not found")
+
+    return [option['text'] for option in select_fields[select_field_name]]
+
+def _fetch_season_select_fields(*, season=None) -> tuple[dict[str, list[dict]], bool]:
+    """
+    Fetch the default page, then follow the season option link when requested.
+
+    Returns:
+        tuple: (select fields, season_applied). season_applied is False when the
+        season is not listed and the default page's fields were returned
+    """
+    select_fields = _fetch_select_fields(url=FIA_DOCUMENTS_URL)
+    if not season:
+        return select_fields, True
+
+    # Each option value is the URL of the page rendered for that selection.
+    season_url = next(
+        (
+            option['value']
+            for option in select_fields.get("Season", [])
+            if option['text'] == season
+        ),
+        None
+    )
+    if not season_url:
+        logger.warning(f"Option {season} was not found in Season")
+        return select_fields, False
+
+    return _fetch_select_fields(url=urljoin(FIA_DOCUMENTS_URL, season_url)), True
+
+def fetch_seasons() -> list[str]:
+    """
+    Get all available seasons without starting a browser.
+
+    Returns:
+        list[str]: List of available seasons
+
+    Raises:
+        requests.RequestException: If the FIA page cannot be downloaded
+        FiaPageError: If the downloaded page has no season filter
+    """
+    select_fields = _fetch_select_fields(url=FIA_DOCUMENTS_URL)
+    return _get_field_options(select_fields=select_fields, select_field_name="Season")
+
+def fetch_championships(*, season=None) -> tuple[list[str], bool]:
+    """
+    Get all available championships for a season without starting a browser.
+
+    Args:
+        season (str, optional): Season in FIA format ("SEASON 2024"). If None, uses the default page
+
+    Returns:
+        tuple: (list of available championships, season_applied). season_applied is False
+        when the season is not listed and the default season's list was returned
+
+    Raises:
+        requests.RequestException: If the FIA page cannot be downloaded
+        FiaPageError: If the downloaded page has no championship filter
+    """
+    select_fields, season_applied = _fetch_season_select_fields(season=season)
+    return _get_field_options(select_fields=select_fields, select_field_name="Championship"), season_applied
+
+def fetch_events(*, season=None) -> tuple[list[str], bool]:
+    """
+    Get all available events/Grand Prix for a season without starting a browser.
+
+    Args:
+        season (str, optional): Season in FIA format ("SEASON 2024"). If None, uses the default page
+
+    Returns:
+        tuple: (list of available events/Grand Prix, season_applied). season_applied is False
+        when the season is not listed and the default season's list was returned
+
+    Raises:
+        requests.RequestException: If the FIA page cannot be downloaded
+        FiaPageError: If the downloaded page has no event filter
+    """
+    select_fields, season_applied = _fetch_season_select_fields(season=season)
+    return _get_field_options(select_fields=select_fields, select_field_name="Event"), season_applied
+
+def fetch_dropdowns(*, season=None) -> tuple[dict[str, list[str]], bool]:
+    """
+    Get the season, championship and event lists for a season in one page fetch.
+
+    Args:
+        season (str, optional): Season in FIA format ("SEASON 2024"). If None, uses the default page
+
+    Returns:
+        tuple: (lists keyed by 'seasons', 'championships' and 'events', season_applied).
+        season_applied is False when the season is not listed
+
+    Raises:
+        requests.RequestException: If the FIA page cannot be downloaded
+        FiaPageError: If the downloaded page is missing one of the filters
+    """
+    select_fields, season_applied = _fetch_season_select_fields(season=season)
+    dropdowns = {
+        'seasons': _get_field_options(select_fields=select_fields, select_field_name="Season"),
+        'championships': _get_field_options(select_fields=select_fields, select_field_name="Championship"),
+        'events': _get_field_options(select_fields=select_fields, select_field_name="Event")
+    }
+    return dropdowns, season_applied
@@ -1,18 +1,25 @@
 import logging
 import re
-import requests
+from enum import Enum
+from functools import lru_cache
 from urllib.parse import urljoin, urlparse
 from datetime import datetime
 from playwright.sync_api import Error as PlaywrightError
+from utils.fia_api import FIA_DOCUMENTS_URL, FIA_HTTP_SESSION
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 FIA_NAVIGATION_TIMEOUT_MS = 15_000
+FIA_PAGE_READY_TIMEOUT_MS = 15_000
 NEXT_SELECT_FIELD = {
     "Season": "Championship",
     "Championship": "Event",
 }
+# "Published on 27.07.25 19:58 CET"
+FIA_PUBLISHED_DATE_PATTERN = re.compile(
+    r"Published on (\d{1,2})\.(\d{1,2})\.(\d{2}) (\d{1,2}):(\d{2})(?: CET)?"
+)
 
 def is_allowed_fia_url(url: str) -> bool:
     """Return True only for HTTPS URLs hosted by fia.com or one of its subdomains."""
@@ -26,29 +33,68 @@ def is_allowed_fia_url(url: str) -> bool:
     except (TypeError, ValueError):
         return False
 
-def normalize_season_format(season_input):
+def open_fia_documents_page(page) -> None:
+    """Open the FIA page and wait for the form actually used by the scraper."""
+    logger.info("NAVIGATING TO FIA DOCUMENTS PAGE...")
+    page.goto(
+        FIA_DOCUMENTS_URL,
+        wait_until='domcontentloaded',
+        timeout=30_000
+    )
+    page.locator('.select-field-wrapper select').first.wait_for(
+        state='visible',
+        timeout=FIA_PAGE_READY_TIMEOUT_MS
+    )
+
+def run_on_fia_page(*, pool, task):
+    """
+    Run `task(page)` on a pooled page already showing the FIA documents form.
+    Every route opens the page here, so navigation settings apply uniformly.
+
+    Args:
+        pool: BrowserPool running the task on one of its browser threads
+        task (callable): Function receiving the ready Playwright page
+
+    Returns:
+        The value returned by the task
+    """
+    def open_and_run(page):
+        open_fia_documents_page(page)
+        return task(page)
+
+    return pool.run(open_and_run)
+
+def normalize_season_format(season_input: str) -> str:
     """
     Normalize season input to FIA expected format.
     
     Args:
-        season_input (str): Season in various formats (e.g., "2015", "SEASON 2015")
+        season_input (str): Season in various formats (e.g., "2015", "season 2015", "SEASON 2015")
     
     Returns:
-        str: Season in FIA format "SEASON YYYY"
+        str: Season in FIA format "SEASON YYYY", or the input unchanged if it matches neither format
     """
     if not season_input:
         return season_input
-    
+
+    # Canonicalize before the cached lookup so equivalent inputs share an entry.
+    normalized_season = _normalize_season_format(season_input.strip().upper())
+
+    # Otherwise return as is (might be a different format we don't know)
+    return normalized_season or season_input
+
+@lru_cache(maxsize=64)
+def _normalize_season_format(season_input: str) -> str | None:
     # If already in correct format, return as is
-    if season_input.upper().startswith("SEASON "):
+    if season_input.startswith("SEASON "):
         return season_input
     
     # If it's just a year (4 digits), add "SEASON " prefix
     if season_input.isdigit() and len(season_input) == 4:
         return f"SEASON {season_input}"
     
-    # Otherwise return as is (might be a different format we don't know)
-    return season_input
+    # Unknown format; the caller keeps the original input
+    return None
 
 def _get_select_locator(*, page, select_field_name):
     """Locate a FIA select by the text of its placeholder option."""
@@ -72,7 +118,19 @@ def _wait_for_page_after_selection(*, page, select_field_name) -> None:
         timeout=FIA_NAVIGATION_TIMEOUT_MS
     )
 
-def select_option_by_type(*, page, select_field_name, option_text) -> bool:
+class SelectionResult(Enum):
+    """Outcome of select_option_by_type; truthy only when the option was selected."""
+    SELECTED = "selected"
+    FIELD_NOT_FOUND = "field_not_found"
+    # The form was left untouched, so the current page is still usable
+    OPTION_NOT_FOUND = "option_not_found"
+    # The selection may have started a navigation that did not complete
+    FAILED = "failed"
+
+    def __bool__(self) -> bool:
+        return self is SelectionResult.SELECTED
+
+def select_option_by_type(*, page, select_field_name: str, option_text: str) -> SelectionResult:
     """
     Find and select from a specific select type on the FIA documents page.
     The page is updated after each selection.
@@ -83,37 +141,54 @@ def select_option_by_type(*, page, select_field_name, option_text) -> bool:
         option_text (str): Text of the option to select
 
     Returns:
-        bool: True if selection was successful, False otherwise
+        SelectionResult: SELECTED on success, otherwise the reason the selection failed
     """
-    select_locator = _get_select_locator(
-        page=page,
-        select_field_name=select_field_name
-    )
-
-    if select_locator.count() == 0:
-        logger.warning(f"Select field {select_field_name} was not found")
-        return False
+    logger.info(f"Selecting {option_text} in {select_field_name}\n")
 
-    option_text_pattern = re.compile(rf"^\s*{re.escape(option_text)}\s*$")
-    matching_option = select_locator.locator(
-        "option",
-        has_text=option_text_pattern
-    )
-    if matching_option.count() == 0:
-        logger.warning(
-            f"Option {option_text} was not found in {select_field_name}"
+    try:
+        # Find the field, match the option and select it in a single round-trip.
+        selection = page.evaluate(
+            """([fieldName, optionText]) => {
+                const select = Array.from(
+                    document.querySelectorAll('.select-field-wrapper select')
+                ).find(element => {
+                    const placeholder = element.querySelector('option[value="0"]');
+                    return placeholder && (placeholder.textContent || '').trim() === fieldName;
+                });
+                if (!select) {
+                    return {fieldFound: false, value: null};
+                }
+
+                const option = Array.from(select.options).find(
+                    element => (element.textContent || '').trim() === optionText
+                );
+                if (!option || option.value === '0') {
+                    return {fieldFound: true, value: null};
+                }
+
+                select.value = option.value;
+                // Fire the same events as a user selection on the next tick, so
+                // the resulting navigation cannot interrupt this evaluation.
+                setTimeout(() => {
+                    select.dispatchEvent(new Event('input', {bubbles: true}));
+                    select.dispatchEvent(new Event('change', {bubbles: true}));
+                }, 0);
+                return {fieldFound: true, value: option.value};
+            }""",
+            [select_field_name, option_text.strip()]
         )
-        return False
 
-    logger.info(f"Selecting {option_text} in {select_field_name}\n")
+        if not selection["fieldFound"]:
+            logger.warning(f"Select field {select_field_name} was not found")
+            return SelectionResult.FIELD_NOT_FOUND
 
-    try:
-        selected_values = select_locator.select_option(label=option_text)
-        if not selected_values or selected_values[0] == "0":
-            logger.warning(f"Option {option_text} was not selected in {select_field_name}")
-            return False
+        if not selection["value"]:
+            logger.warning(
+                f"Option {option_text} was not found in {select_field_name}"
+            )
+            return SelectionResult.OPTION_NOT_FOUND
 
-        expected_url = urljoin(page.url, selected_values[0])
+        expected_url = urljoin(page.url, selection["value"])
         page.wait_for_url(
             expected_url,
             wait_until="domcontentloaded",
@@ -123,12 +198,12 @@ def select_option_by_type(*, page, select_field_name, option_text) -> bool:
             page=page,
             select_field_name=select_field_name
         )
-        return True
+        return SelectionResult.SELECTED
     except PlaywrightError as error:
         logger.warning(
             f"Failed to select {option_text} in {select_field_name}: {error}"
         )
-        return False
+        return SelectionResult.FAILED
 
 def _is_navigation_context_error(error: PlaywrightError) -> bool:
     """Identify transient errors caused by a document being replaced."""
@@ -138,6 +213,37 @@ def _is_navigation_context_error(error: PlaywrightError) -> bool:
         or "frame was detached" in message
     )
 
+def get_select_fields(*, page) -> dict[str, list[dict]]:
+    """
+    Read every FIA select field and its options in a single page round-trip.
+
+    Args:
+        page: Playwright page object
+
+    Returns:
+        dict: Options ({'value', 'text'}) keyed by select field name ("Season", "Championship", "Event")
+    """
+    return page.evaluate(
+        """() => {
+            const fields = {};
+            for (const select of document.querySelectorAll('.select-field-wrapper select')) {
+                const placeholder = select.querySelector('option[value="0"]');
+                const name = placeholder ? (placeholder.textContent || '').trim() : '';
+                if (!name || name in fields) {
+                    continue;
+                }
+                fields[name] = Array.from(
+                    select.querySelectorAll('option:not([value="0"])'),
+                    option => ({
+                        value: option.value,
+                        text: (option.textContent || '').trim()
+                    })
+                );
+            }
+            return fields;
+        }"""
+    )
+
 def get_select_options(*, page, select_field_name) -> list[str]:
     """
     Get all available options from a specific select field.
@@ -151,24 +257,9 @@ def get_select_options(*, page, select_field_name) -> list[str]:
     """
     for attempt in range(2):
         try:
-            select_locator = _get_select_locator(
-                page=page,
-                select_field_name=select_field_name
-            )
-            if select_locator.count() == 0:
-                return []
-
-            select_locator.wait_for(
-                state="visible",
-                timeout=FIA_NAVIGATION_TIMEOUT_MS
-            )
-            options = select_locator.locator('option:not([value="0"])')
-            option_rows = options.evaluate_all(
-                """elements => elements.map(option => ({
-                    value: option.value,
-                    text: (option.textContent || '').trim()
-                }))"""
-            )
+            # Callers reach this point after the page or selection wait, so the
+            # selects are already rendered and can be read without polling.
+            option_rows = get_select_fields(page=page).get(select_field_name, [])
             return [
                 option["text"]
                 for option in option_rows
@@ -188,6 +279,20 @@ def get_select_options(*, page, select_field_name) -> list[str]:
 
     return []
 
+def _select_season(*, page, season) -> bool:
+    """
+    Select the requested season, if any.
+
+    Returns:
+        bool: True when no season was requested or it was selected, False when the
+        page still shows the default season
+    """
+    if not season:
+        return True
+
+    normalized_season = normalize_season_format(season)
+    return bool(select_option_by_type(page=page, select_field_name="Season", option_text=normalized_season))
+
 def get_available_seasons(*, page) -> list[str]:
     """
     Get all available seasons from the FIA documents page.
@@ -200,7 +305,7 @@ def get_available_seasons(*, page) -> list[str]:
     """
     return get_select_options(page=page, select_field_name="Season")
 
-def get_available_championships(*, page, season=None) -> list[str]:
+def get_available_championships(*, page, season=None) -> tuple[list[str], bool]:
     """
     Get all available championships for a specific season.
     
@@ -209,16 +314,15 @@ def get_available_championships(*, page, season=None) -> list[str]:
         season (str, optional): Season to select first. If None, uses default/current selection
     
     Returns:
-        list[str]: List of available championships
+        tuple: (list of available championships, season_applied). season_applied is False
+        when the requested season could not be selected and the default season's
+        list was returned instead
     """
-    # Select season first if provided
-    if season:
-        normalized_season = normalize_season_format(season)
-        select_option_by_type(page=page, select_field_name="Season", option_text=normalized_season)
+    season_applied = _select_season(page=page, season=season)
     
-    return get_select_options(page=page, select_field_name="Championship")
+    return get_select_options(page=page, select_field_name="Championship"), season_applied
 
-def get_available_events(*, page, season=None) -> list[str]:
+def get_available_events(*, page, season=None) -> tuple[list[str], bool]:
     """
     Get all available events/Grand Prix for a specific season.
     
@@ -227,14 +331,43 @@ def get_available_events(*, page, season=None) -> list[str]:
         season (str, optional): Season to select first. If None, uses default/current selection
     
     Returns:
-        list[str]: List of available events/Grand Prix
+        tuple: (list of available events/Grand Prix, season_applied). season_applied is False
+        when the requested season could not be selected and the default season's
+        list was returned instead
     """
-    # Select season first if provided
-    if season:
-        normalized_season = normalize_season_format(season)
-        select_option_by_type(page=page, select_field_name="Season", option_text=normalized_season)
+    season_applied = _select_season(page=page, season=season)
     
-    return get_select_options(page=page, select_field_name="Event")
+    return get_select_options(page=page, select_field_name="Event"), season_applied
+
+def get_available_dropdowns(*, page, season=None) -> tuple[dict[str, list[str]], bool]:
+    """
+    Get the season, championship and event lists for a specific season.
+    The selected season page renders all three selects, so they are read together.
+
+    Args:
+        page: Playwright page object
+        season (str, optional): Season to select first. If None, uses default/current selection
+
+    Returns:
+        tuple: (lists keyed by 'seasons', 'championships' and 'events', season_applied).
+        season_applied is False when the requested season could not be selected
+    """
+    season_applied = _select_season(page=page, season=season)
+
+    select_fields = get_select_fields(page=page)
+    dropdowns = {
+        key: [
+            option["text"]
+            for option in select_fields.get(select_field_name, [])
+            if option["value"] and option["text"]
+        ]
+        for key, select_field_name in (
+            ('seasons', "Season"),
+            ('championships', "Championship"),
+            ('events', "Event")
+        )
+    }
+    return dropdowns, season_applied
 
 def get_docs(*, page) -> list[dict]:
     """
@@ -247,29 +380,39 @@ def get_docs(*, page) -> list[dict]:
         list: List with single object containing info and docs
     """
 
-    # Locators are resolved against the current DOM and remain safe after navigation.
-    gp_name = page.locator(".event-title.active").first.inner_text()
-
-    season_text = (
-        page.locator(".form-type-select")
-        .nth(0)
-        .locator("select option")
-        .first
-        .inner_text()
+    # Read everything in one round-trip instead of several locator calls per row.
+    page_data: dict = page.evaluate(
+        """() => {
+            const text = element => (element ? element.innerText.trim() : '');
+            const seasonSelect = document.querySelectorAll('.form-type-select')[0];
+            return {
+                gpName: text(document.querySelector('.event-title.active')),
+                seasonText: text(seasonSelect && seasonSelect.querySelector('select option')),
+                rows: Array.from(
+                    document.querySelectorAll('ul.document-row-wrapper li'),
+                    item => {
+                        const link = item.querySelector('a');
+                        return {
+                            href: (link && link.getAttribute('href')) || '',
+                            title: text(item.querySelector('div.title')),
+                            published: text(item.querySelector('div.published'))
+                        };
+                    }
+                )
+            };
+        }"""
     )
-    season_year = season_text.split(' ')[1]
 
-    # Create the docs list for all documents
-    docs_list = []
+    gp_name = page_data['gpName']
+    season_parts = page_data['seasonText'].split(' ')
+    season_year = season_parts[1] if len(season_parts) > 1 else ""
 
-    # Find all document list items within ul.document-row-wrapper
-    document_items = page.locator('ul.document-row-wrapper li')
+    # Create the docs list for all documents
+    docs_list: list[dict[str, str]] = []
 
-    for index in range(document_items.count()):
-        item = document_items.nth(index)
-        # Get the href attribute from the link
-        link_element = item.locator('a').first
-        href = link_element.get_attribute('href') if link_element.count() else ""
+    rows: list[dict[str, str]] = page_data['rows']
+    for row in rows:
+        href = row['href']
 
         # Convert relative URL to absolute URL
         if href and href.startswith('/'):
@@ -277,17 +420,8 @@ def get_docs(*, page) -> list[dict]:
         else:
             url = href
 
-        # Get title from div with class 'title'
-        title_element = item.locator('div.title').first
-        title = title_element.inner_text().strip() if title_element.count() else ""
-
-        # Get published date from div with class 'published'
-        published_element = item.locator('div.published').first
-        published_raw = (
-            published_element.inner_text().strip()
-            if published_element.count()
-            else ""
-        )
+        title = row['title']
+        published_raw = row['published']
 
         # Convert to ISO format
         date = convert_fia_date_to_iso(date_text=published_raw)
@@ -314,7 +448,7 @@ def get_docs(*, page) -> list[dict]:
     return response
 
 
-def download_file(*, url) -> tuple:
+def download_file(*, url: str) -> tuple:
     """
     Get file content and metadata for streaming download.
 
@@ -330,7 +464,7 @@ def download_file(*, url) -> tuple:
         return None, None
 
     try:
-        response = requests.get(url, stream=True, timeout=(10, 60))
+        response = FIA_HTTP_SESSION.get(url, stream=True, timeout=(10, 60))
         response.raise_for_status()
 
         # Requests follows redirects by default; validate the final destination too.
@@ -351,7 +485,7 @@ def download_file(*, url) -> tuple:
         logger.error(f"Error downloading file: {e}")
         return None, None
 
-def convert_fia_date_to_iso(*, date_text) -> str:
+def convert_fia_date_to_iso(*, date_text: str) -> str:
     """
     Convert FIA date format to ISO format.
 
@@ -361,15 +495,16 @@ def convert_fia_date_to_iso(*, date_text) -> str:
     Returns:
         str: Date in ISO format or original text if conversion fails
     """
-    if not date_text or "Published on" not in date_text:
+    # Called for every document row, so avoid strptime's format parsing.
+    match = FIA_PUBLISHED_DATE_PATTERN.fullmatch(date_text or "")
+    if not match:
         return date_text
 
+    day, month, year, hour, minute = map(int, match.groups())
+    # Same two-digit year pivot as strptime's %y: 69-99 -> 19xx, 00-68 -> 20xx
+    year += 1900 if year >= 69 else 2000
+
     try:
-        # Extract date part after "Published on "
-        date_part = date_text.replace("Published on ", "").replace(" CET", "")
-        # Parse format "27.07.25 19:58"
-        dt = datetime.strptime(date_part, "%d.%m.%y %H:%M")
-        # Convert to ISO format string
-        return dt.isoformat()
+        return datetime(year, month, day, hour, minute).isoformat()
     except ValueError:
-        return date_text  # Fallback to original if parsing fails
+        return date_text  # Fallback to original if the date is out of range